@@ -2,7 +2,9 @@
 Search Agent - Orchestrates searches across multiple platforms
 """
 
+import asyncio
 import logging
+import threading
 from typing import List, Dict, Any
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -15,13 +17,17 @@ logger = logging.getLogger(__name__)
 class SearchAgent:
     """Orchestrates search operations across multiple platforms"""
     
-    def __init__(self, config):
+    def __init__(self, config, cache=None):
         self.config = config
+        self.cache = cache  # Optional SearchCache consulted before hitting a platform
         self.scrapers = {
             'youtube': YouTubeScraper(config),
             'twitter': TwitterScraper(config),
             'google': GoogleScraper(config)
         }
+        # Scraper clients (e.g. the googleapiclient/httplib2 transport) are not
+        # thread-safe, so concurrent searches are serialized per platform
+        self._platform_locks = {platform: threading.Lock() for platform in self.scrapers}
     
     def search_platform(self, platform: str, query: str, max_results: int = 50) -> List[Dict[str, Any]]:
         """
@@ -38,15 +44,41 @@ class SearchAgent:
         if platform not in self.scrapers:
             raise ValueError(f"Unsupported platform: {platform}")
         
+        if self.cache is not None:
+            cached = self.cache.get(platform, query, max_results)
+            if cached is not None:
+                logger.info("Loaded %d cached results for %s", len(cached), platform)
+                return cached
+        
         scraper = self.scrapers[platform]
         try:
-            results = scraper.search(query, max_results)
-            logger.info(f"Successfully collected {len(results)} results from {platform}")
+            with self._platform_locks[platform]:
+                results = scraper.search(query, max_results)
+            logger.info("Successfully collected %d results from %s", len(results), platform)
+            if self.cache is not None and results:
+                self.cache.set(platform, query, max_results, results)
             return results
         except Exception as e:
-            logger.error(f"Error searching {platform}: {str(e)}")
+            logger.error("Error searching %s: %s", platform, e)
             return []
     
+    async def search_platform_async(self, platform: str, query: str, max_results: int = 50) -> List[Dict[str, Any]]:
+        """
+        Awaitable variant of search_platform
+        
+        The scrapers use blocking HTTP clients, so the search runs in the
+        default executor and the event loop stays free to drive other queries.
+        
+        Args:
+            platform: Platform name ('youtube', 'twitter', 'google')
+            query: Search query
+            max_results: Maximum number of results to return
+            
+        Returns:
+            List of search results
+        """
+        return await asyncio.to_thread(self.search_platform, platform, query, max_results)
+    
     def search_all_platforms(self, query: str, platforms: List[str], max_results: int = 50) -> Dict[str, List[Dict]]:
         """
         Search multiple platforms simultaneously
@@ -76,7 +108,7 @@ class SearchAgent:
                     platform_results = future.result()
                     results[platform] = platform_results
                 except Exception as e:
-                    logger.error(f"Error collecting results from {platform}: {str(e)}")
+                    logger.error("Error collecting results from %s: %s", platform, e)
                     results[platform] = []
         
         return results
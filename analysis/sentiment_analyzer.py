@@ -75,22 +75,42 @@ class SentimentAnalyzer:
         """
         logger.info("Starting batch sentiment analysis...")
         
-        sentiment_results = {}
-        total_posts = 0
-        
+        # Flatten every keyword/platform list into one batch
+        post_ids = []
+        texts = []
         for keyword_data in processed_data.values():
             for platform_data in keyword_data.values():
                 for post in platform_data:
-                    post_id = post.get('id', f'unknown_{total_posts}')
-                    text_content = post.get('text_content', '')
-                    
-                    sentiment_result = self.analyze_text(text_content)
-                    sentiment_results[post_id] = sentiment_result
-                    total_posts += 1
+                    post_ids.append(post.get('id', f'unknown_{len(post_ids)}'))
+                    texts.append(post.get('text_content', ''))
+        
+        sentiment_results = dict(zip(post_ids, self.analyze_texts(texts)))
         
-        logger.info(f"Completed sentiment analysis for {total_posts} posts")
+        logger.info(f"Completed sentiment analysis for {len(post_ids)} posts")
         return sentiment_results
     
+    def analyze_texts(self, texts: List[str]) -> List[Dict[str, Union[str, float]]]:
+        """
+        Analyze sentiment for a flat list of texts
+        
+        Identical texts (retweets, syndicated titles) are only scored once.
+        
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            Sentiment results in the same order as the input texts
+        """
+        scored = {}
+        results = []
+        for text in texts:
+            result = scored.get(text)
+            if result is None:
+                result = scored[text] = self.analyze_text(text)
+            results.append(dict(result))
+        
+        return results
+    
     def analyze_text(self, text: str) -> Dict[str, Union[str, float]]:
         """
         Analyze sentiment of a single text
@@ -2,126 +2,132 @@
 Configuration settings for Atomberg SoV Analysis Agent
 """
 
+import functools
 import os
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
+def _env(name: str):
+    """Dataclass field read from an environment variable at construction time"""
+    return field(default_factory=lambda: os.getenv(name, None))
+
+@dataclass(frozen=True, eq=False)
 class Config:
     """Configuration class for the SoV analysis agent"""
     
-    def __init__(self):
-        # API Keys (to be set via environment variables)
-        self.YOUTUBE_API_KEY = os.getenv('YOUTUBE_API_KEY', None)
-        self.TWITTER_API_KEY = os.getenv('TWITTER_API_KEY', None)
-        self.TWITTER_API_SECRET = os.getenv('TWITTER_API_SECRET', None)
-        self.TWITTER_ACCESS_TOKEN = os.getenv('TWITTER_ACCESS_TOKEN', None)
-        self.TWITTER_ACCESS_TOKEN_SECRET = os.getenv('TWITTER_ACCESS_TOKEN_SECRET', None)
-        self.TWITTER_BEARER_TOKEN = os.getenv('TWITTER_BEARER_TOKEN', None)
-        self.OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', None)
-        
-        # Scraping Settings
-        self.SCRAPING_DELAY = 2  # Seconds between requests
-        self.MAX_RETRIES = 3
-        self.REQUEST_TIMEOUT = 10  # Seconds
-        
-        # User Agent for web scraping
-        self.USER_AGENT = (
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
-            'AppleWebKit/537.36 (KHTML, like Gecko) '
-            'Chrome/91.0.4472.124 Safari/537.36'
-        )
-        
-        # Competitor brands to track
-        self.COMPETITORS = [
-            'Havells', 'Orient', 'Bajaj', 'Crompton', 'Usha', 
-            'Symphony', 'Voltas', 'Khaitan', 'Luminous'
+    # API Keys (to be set via environment variables)
+    YOUTUBE_API_KEY: Optional[str] = _env('YOUTUBE_API_KEY')
+    TWITTER_API_KEY: Optional[str] = _env('TWITTER_API_KEY')
+    TWITTER_API_SECRET: Optional[str] = _env('TWITTER_API_SECRET')
+    TWITTER_ACCESS_TOKEN: Optional[str] = _env('TWITTER_ACCESS_TOKEN')
+    TWITTER_ACCESS_TOKEN_SECRET: Optional[str] = _env('TWITTER_ACCESS_TOKEN_SECRET')
+    TWITTER_BEARER_TOKEN: Optional[str] = _env('TWITTER_BEARER_TOKEN')
+    OPENAI_API_KEY: Optional[str] = _env('OPENAI_API_KEY')
+    
+    # Scraping Settings
+    SCRAPING_DELAY: int = 2  # Seconds between requests
+    MAX_RETRIES: int = 3
+    REQUEST_TIMEOUT: int = 10  # Seconds
+    
+    # User Agent for web scraping
+    USER_AGENT: str = (
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+        'AppleWebKit/537.36 (KHTML, like Gecko) '
+        'Chrome/91.0.4472.124 Safari/537.36'
+    )
+    
+    # Competitor brands to track
+    COMPETITORS: List[str] = field(default_factory=lambda: [
+        'Havells', 'Orient', 'Bajaj', 'Crompton', 'Usha', 
+        'Symphony', 'Voltas', 'Khaitan', 'Luminous'
+    ])
+    
+    # Keywords to analyze (can be extended)
+    DEFAULT_KEYWORDS: List[str] = field(default_factory=lambda: [
+        'smart fan', 'smart ceiling fan', 'IoT fan', 'wifi fan',
+        'intelligent fan', 'BLDC fan', 'energy efficient fan'
+    ])
+    
+    # Platform-specific settings
+    PLATFORM_SETTINGS: Dict[str, dict] = field(default_factory=lambda: {
+        'youtube': {
+            'max_results_per_request': 50,
+            'include_comments': True,
+            'max_comments_per_video': 20
+        },
+        'twitter': {
+            'max_results_per_request': 100,
+            'include_retweets': True,
+            'tweet_fields': ['created_at', 'author_id', 'public_metrics', 'lang']
+        },
+        'google': {
+            'max_pages': 5,
+            'results_per_page': 10,
+            'include_ads': False
+        }
+    })
+    
+    # Analysis settings
+    ANALYSIS_SETTINGS: Dict[str, object] = field(default_factory=lambda: {
+        'sentiment_threshold': 0.1,  # Minimum confidence for sentiment classification
+        'min_engagement_for_quality': 10,  # Minimum engagement for quality posts
+        'relevance_keywords': [
+            'smart', 'ceiling', 'fan', 'BLDC', 'energy', 'efficient',
+            'remote', 'app', 'wifi', 'IoT', 'motor', 'speed', 'quiet'
         ]
-        
-        # Keywords to analyze (can be extended)
-        self.DEFAULT_KEYWORDS = [
-            'smart fan', 'smart ceiling fan', 'IoT fan', 'wifi fan',
-            'intelligent fan', 'BLDC fan', 'energy efficient fan'
+    })
+    
+    # Output settings
+    OUTPUT_SETTINGS: Dict[str, object] = field(default_factory=lambda: {
+        'save_raw_data': True,
+        'create_visualizations': True,
+        'generate_report': True,
+        'export_formats': ['json', 'csv', 'txt']
+    })
+    
+    # Brand mention patterns (case insensitive)
+    BRAND_PATTERNS: Dict[str, List[str]] = field(default_factory=lambda: {
+        'atomberg': [
+            'atomberg', 'atom berg', 'atomburg', '@atomberg',
+            'atomberg fan', 'atomberg ceiling fan'
+        ],
+        'havells': [
+            'havells', 'havell', '@havells', 'havells fan',
+            'havells ceiling fan', 'havells smart fan'
+        ],
+        'orient': [
+            'orient', 'orient fan', 'orient electric', '@orient',
+            'orient ceiling fan', 'orient smart fan'
+        ],
+        'bajaj': [
+            'bajaj', 'bajaj fan', 'bajaj electricals', '@bajaj',
+            'bajaj ceiling fan', 'bajaj smart fan'
+        ],
+        'crompton': [
+            'crompton', 'crompton greaves', '@crompton',
+            'crompton fan', 'crompton ceiling fan'
+        ],
+        'usha': [
+            'usha', 'usha international', '@usha',
+            'usha fan', 'usha ceiling fan'
         ]
-        
-        # Platform-specific settings
-        self.PLATFORM_SETTINGS = {
-            'youtube': {
-                'max_results_per_request': 50,
-                'include_comments': True,
-                'max_comments_per_video': 20
-            },
-            'twitter': {
-                'max_results_per_request': 100,
-                'include_retweets': True,
-                'tweet_fields': ['created_at', 'author_id', 'public_metrics', 'lang']
-            },
-            'google': {
-                'max_pages': 5,
-                'results_per_page': 10,
-                'include_ads': False
-            }
-        }
-        
-        # Analysis settings
-        self.ANALYSIS_SETTINGS = {
-            'sentiment_threshold': 0.1,  # Minimum confidence for sentiment classification
-            'min_engagement_for_quality': 10,  # Minimum engagement for quality posts
-            'relevance_keywords': [
-                'smart', 'ceiling', 'fan', 'BLDC', 'energy', 'efficient',
-                'remote', 'app', 'wifi', 'IoT', 'motor', 'speed', 'quiet'
-            ]
-        }
-        
-        # Output settings
-        self.OUTPUT_SETTINGS = {
-            'save_raw_data': True,
-            'create_visualizations': True,
-            'generate_report': True,
-            'export_formats': ['json', 'csv', 'txt']
-        }
-        
-        # Brand mention patterns (case insensitive)
-        self.BRAND_PATTERNS = {
-            'atomberg': [
-                'atomberg', 'atom berg', 'atomburg', '@atomberg',
-                'atomberg fan', 'atomberg ceiling fan'
-            ],
-            'havells': [
-                'havells', 'havell', '@havells', 'havells fan',
-                'havells ceiling fan', 'havells smart fan'
-            ],
-            'orient': [
-                'orient', 'orient fan', 'orient electric', '@orient',
-                'orient ceiling fan', 'orient smart fan'
-            ],
-            'bajaj': [
-                'bajaj', 'bajaj fan', 'bajaj electricals', '@bajaj',
-                'bajaj ceiling fan', 'bajaj smart fan'
-            ],
-            'crompton': [
-                'crompton', 'crompton greaves', '@crompton',
-                'crompton fan', 'crompton ceiling fan'
-            ],
-            'usha': [
-                'usha', 'usha international', '@usha',
-                'usha fan', 'usha ceiling fan'
-            ]
-        }
-        
-        # Quality scoring weights
-        self.QUALITY_WEIGHTS = {
-            'content_length': 0.2,
-            'engagement_rate': 0.3,
-            'theme_relevance': 0.2,
-            'keyword_relevance': 0.2,
-            'platform_authority': 0.1
-        }
-        
-        # SoV calculation weights
-        self.SOV_WEIGHTS = {
-            'mention_share': 0.4,
-            'engagement_share': 0.4,
-            'sentiment_share': 0.2
-        }
+    })
+    
+    # Quality scoring weights
+    QUALITY_WEIGHTS: Dict[str, float] = field(default_factory=lambda: {
+        'content_length': 0.2,
+        'engagement_rate': 0.3,
+        'theme_relevance': 0.2,
+        'keyword_relevance': 0.2,
+        'platform_authority': 0.1
+    })
+    
+    # SoV calculation weights
+    SOV_WEIGHTS: Dict[str, float] = field(default_factory=lambda: {
+        'mention_share': 0.4,
+        'engagement_share': 0.4,
+        'sentiment_share': 0.2
+    })
     
     def get_platform_config(self, platform: str) -> dict:
         """Get configuration for a specific platform"""
@@ -170,3 +176,8 @@ class Config:
             'competitors_count': len(self.COMPETITORS),
             'default_keywords_count': len(self.DEFAULT_KEYWORDS)
         }
+
+@functools.lru_cache(maxsize=1)
+def load_config() -> Config:
+    """Build the configuration once per process and reuse it"""
+    return Config()
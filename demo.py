@@ -9,15 +9,18 @@ import os
 import json
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add the project root to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from config.settings import Config
+from config.settings import load_config
 from agents.search_agent import SearchAgent
 from analysis.sov_calculator import SoVCalculator
-from analysis.sentiment_analyzer import SentimentAnalyzer
 from utils.data_processor import DataProcessor
-from utils.visualizer import Visualizer
 
 def run_demo():
     """Run a demonstration of the SoV analysis"""
@@ -25,12 +28,16 @@ def run_demo():
     print("=" * 60)
     
     # Initialize configuration
-    config = Config()
+    config = load_config()
     print(f"✅ Configuration loaded")
     print(f"   - Competitors tracked: {len(config.COMPETITORS)}")
     print(f"   - Default keywords: {len(config.DEFAULT_KEYWORDS)}")
     
-    # Initialize components
+    # Initialize components; the sentiment (VADER/TextBlob) and plotting
+    # (matplotlib/plotly) stacks are only imported once the demo actually runs
+    from analysis.sentiment_analyzer import SentimentAnalyzer
+    from utils.visualizer import Visualizer
+    
     search_agent = SearchAgent(config)
     sov_calculator = SoVCalculator(config)
     sentiment_analyzer = SentimentAnalyzer()
@@ -122,8 +129,15 @@ def run_demo():
     }
     
     results_file = f'data/demo_results_{timestamp}.json'
-    with open(results_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    # Serialize in one shot and hand it to a 1 MB buffer so the payload
+    # goes out in a handful of write() calls
+    if orjson is not None:
+        with open(results_file, 'wb', buffering=1 << 20) as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                                 default=str))
+    else:
+        with open(results_file, 'w', buffering=1 << 20) as f:
+            json.dump(results, f, indent=2, default=str)
     
     print(f"   ✅ Results saved to {results_file}")
     
@@ -176,28 +190,25 @@ def run_demo():
 
 def generate_demo_insights(sov_metrics: dict, processed_data: dict) -> dict:
     """Generate insights for the demo"""
-    insights = {
-        'key_findings': [],
-        'competitive_positioning': {},
-        'content_recommendations': [],
-        'marketing_recommendations': []
-    }
+    findings = []
+    marketing = []
+    content = []
     
     overall_sov = sov_metrics.get('overall_sov', 0)
     
     # Generate findings based on SoV performance
     if overall_sov < 0.15:
-        insights['key_findings'].append("Low market visibility: Atomberg needs increased content marketing")
-        insights['marketing_recommendations'].extend([
+        findings.append("Low market visibility: Atomberg needs increased content marketing")
+        marketing += (
             "Launch comprehensive YouTube content strategy",
             "Increase social media engagement and posting frequency",
             "Develop SEO-optimized blog content around smart fan topics"
-        ])
+        )
     elif overall_sov > 0.25:
-        insights['key_findings'].append("Strong market presence: Atomberg has significant share of voice")
-        insights['marketing_recommendations'].append("Maintain momentum and explore new keyword opportunities")
+        findings.append("Strong market presence: Atomberg has significant share of voice")
+        marketing.append("Maintain momentum and explore new keyword opportunities")
     else:
-        insights['key_findings'].append("Moderate market presence: Room for strategic growth")
+        findings.append("Moderate market presence: Room for strategic growth")
     
     # Platform-specific insights
     platform_breakdown = sov_metrics.get('platform_breakdown', {})
@@ -205,26 +216,32 @@ def generate_demo_insights(sov_metrics: dict, processed_data: dict) -> dict:
     
     if best_platform:
         platform_name, platform_sov = best_platform
-        insights['key_findings'].append(f"Best performing platform: {platform_name} ({platform_sov:.1%} SoV)")
-        insights['marketing_recommendations'].append(f"Double down on {platform_name} content strategy")
+        findings.append(f"Best performing platform: {platform_name} ({platform_sov:.1%} SoV)")
+        marketing.append(f"Double down on {platform_name} content strategy")
     
     # Sentiment insights
     sentiment_share = sov_metrics.get('sentiment_share', {})
     positive_sentiment = sentiment_share.get('positive', 0)
     
     if positive_sentiment > 0.6:
-        insights['key_findings'].append("Strong positive sentiment: Brand perception is favorable")
+        findings.append("Strong positive sentiment: Brand perception is favorable")
     elif positive_sentiment < 0.4:
-        insights['key_findings'].append("Sentiment challenges: Address customer concerns")
-        insights['content_recommendations'].append("Create content addressing common pain points")
+        findings.append("Sentiment challenges: Address customer concerns")
+        content.append("Create content addressing common pain points")
     
-    insights['content_recommendations'].extend([
+    content += (
         "Develop installation tutorial videos",
         "Create energy savings comparison content",
         "Showcase smart home integration use cases"
-    ])
+    )
     
-    return insights
+    # Assemble once so each list is built in place rather than re-grown
+    return {
+        'key_findings': findings,
+        'competitive_positioning': {},
+        'content_recommendations': content,
+        'marketing_recommendations': marketing
+    }
 
 if __name__ == "__main__":
     try:
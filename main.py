@@ -5,17 +5,25 @@ Main application entry point
 """
 
 import argparse
+import asyncio
+import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
-from agents.search_agent import SearchAgent
-from analysis.sov_calculator import SoVCalculator
-from analysis.sentiment_analyzer import SentimentAnalyzer
-from utils.data_processor import DataProcessor
-from utils.visualizer import Visualizer
-from config.settings import Config
+from config.settings import Config, load_config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 # Configure logging
 logging.basicConfig(
@@ -28,12 +36,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Output files are written through a 1 MiB buffer so large payloads go out in few syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
 class AtombergSoVAgent:
     """Main agent class for Atomberg Share of Voice analysis"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, use_cache: bool = True, compress_results: bool = True):
+        # Pipeline components pull in the scraping, NLP and plotting stacks, so
+        # they are imported here rather than at module load to keep --help fast
+        from agents.search_agent import SearchAgent
+        from analysis.sov_calculator import SoVCalculator
+        from analysis.sentiment_analyzer import SentimentAnalyzer
+        from utils.data_processor import DataProcessor
+        from utils.visualizer import Visualizer
+        from utils.search_cache import SearchCache
+        
         self.config = config
-        self.search_agent = SearchAgent(config)
+        self.use_cache = use_cache
+        self.compress_results = compress_results
+        self.search_agent = SearchAgent(config, cache=SearchCache() if use_cache else None)
         self.sov_calculator = SoVCalculator(config)
         self.sentiment_analyzer = SentimentAnalyzer()
         self.data_processor = DataProcessor()
@@ -54,28 +76,8 @@ class AtombergSoVAgent:
         logger.info(f"Starting SoV analysis for keywords: {keywords}")
         logger.info(f"Platforms: {platforms}, Results per platform: {num_results}")
         
-        all_results = {}
-        
-        # Step 1: Search and collect data from all platforms
-        for keyword in keywords:
-            logger.info(f"Analyzing keyword: '{keyword}'")
-            keyword_results = {}
-            
-            for platform in platforms:
-                logger.info(f"Searching {platform} for '{keyword}'")
-                try:
-                    platform_data = self.search_agent.search_platform(
-                        platform=platform,
-                        query=keyword,
-                        max_results=num_results
-                    )
-                    keyword_results[platform] = platform_data
-                    logger.info(f"Collected {len(platform_data)} results from {platform}")
-                except Exception as e:
-                    logger.error(f"Error searching {platform}: {str(e)}")
-                    keyword_results[platform] = []
-            
-            all_results[keyword] = keyword_results
+        # Step 1: Search and collect data from all platforms concurrently
+        all_results = self._search_all(keywords, platforms, num_results)
         
         # Step 2: Process and clean the collected data
         logger.info("Processing collected data...")
@@ -93,10 +95,6 @@ class AtombergSoVAgent:
         logger.info("Generating insights and recommendations...")
         insights = self._generate_insights(sov_metrics, processed_data)
         
-        # Step 6: Create visualizations
-        logger.info("Creating visualizations...")
-        charts = self.visualizer.create_sov_dashboard(sov_metrics, processed_data)
-        
         # Compile final results
         final_results = {
             'metadata': {
@@ -104,22 +102,105 @@ class AtombergSoVAgent:
                 'platforms': platforms,
                 'num_results': num_results,
                 'analysis_date': datetime.now().isoformat(),
-                'total_posts_analyzed': sum(len(data) for keyword_data in processed_data.values() 
-                                          for data in keyword_data.values())
+                # Already counted by the SoV calculator's flattening pass
+                'total_posts_analyzed': sov_metrics.get('total_posts_analyzed', 0)
             },
-            'raw_data': processed_data,
             'sentiment_analysis': sentiment_results,
             'sov_metrics': sov_metrics,
-            'insights': insights,
-            'visualizations': charts
+            'insights': insights
         }
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Step 7: Save results
-        self._save_results(final_results)
+        # Steps 6 & 7: Save results in the background while the charts render.
+        # Neither side mutates the nested data, so a shallow copy is enough.
+        logger.info("Creating visualizations and saving results...")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            save_future = executor.submit(self._save_results, dict(final_results), processed_data, timestamp)
+            if self.use_cache:
+                charts = self.visualizer.create_cached_sov_dashboard(sov_metrics, processed_data)
+            else:
+                charts = self.visualizer.create_sov_dashboard(sov_metrics, processed_data)
+            raw_data_ref = save_future.result()
+        
+        # Raw posts live in the Parquet sidecar; load_raw_data() reads them back on demand
+        if raw_data_ref:
+            final_results['raw_data_ref'] = raw_data_ref
+        else:
+            final_results['raw_data'] = processed_data
+        final_results['visualizations'] = charts
+        self._save_charts(charts, timestamp)
         
         logger.info("Analysis completed successfully!")
         return final_results
     
+    def _search_all(self, keywords: List[str], platforms: List[str], num_results: int) -> Dict:
+        """Run all searches concurrently, on the event loop when one can be started"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._collect_results(keywords, platforms, num_results))
+        
+        # asyncio.run() cannot be nested inside a running loop (e.g. Jupyter)
+        return self._collect_results_threaded(keywords, platforms, num_results)
+    
+    async def _search_one(self, keyword: str, platform: str, num_results: int) -> List[Dict]:
+        """Search a single platform for a single keyword"""
+        logger.info("Searching %s for '%s'", platform, keyword)
+        return await self.search_agent.search_platform_async(
+            platform=platform,
+            query=keyword,
+            max_results=num_results
+        )
+    
+    async def _collect_results(self, keywords: List[str], platforms: List[str], num_results: int) -> Dict:
+        """Issue every keyword x platform search at once and regroup the results"""
+        queries = [(keyword, platform) for keyword in keywords for platform in platforms]
+        results = await asyncio.gather(
+            *(self._search_one(keyword, platform, num_results) for keyword, platform in queries),
+            return_exceptions=True
+        )
+        
+        all_results = {keyword: {} for keyword in keywords}
+        for (keyword, platform), platform_data in zip(queries, results):
+            if isinstance(platform_data, Exception):
+                logger.error("Error searching %s: %s", platform, platform_data)
+                platform_data = []
+            else:
+                logger.info("Collected %d results from %s", len(platform_data), platform)
+            all_results[keyword][platform] = platform_data
+        
+        return all_results
+    
+    def _collect_results_threaded(self, keywords: List[str], platforms: List[str], num_results: int) -> Dict:
+        """Thread-pool fallback for _collect_results"""
+        all_results = {keyword: {platform: [] for platform in platforms} for keyword in keywords}
+        max_workers = max(1, min(32, len(keywords) * len(platforms)))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_query = {}
+            for keyword in keywords:
+                for platform in platforms:
+                    logger.info("Searching %s for '%s'", platform, keyword)
+                    future = executor.submit(
+                        self.search_agent.search_platform,
+                        platform=platform,
+                        query=keyword,
+                        max_results=num_results
+                    )
+                    future_to_query[future] = (keyword, platform)
+            
+            for future in as_completed(future_to_query):
+                keyword, platform = future_to_query[future]
+                error = future.exception()
+                if error is not None:
+                    logger.error("Error searching %s: %s", platform, error)
+                    continue
+                platform_data = future.result()
+                all_results[keyword][platform] = platform_data
+                logger.info("Collected %d results from %s", len(platform_data), platform)
+        
+        return all_results
+    
     def _generate_insights(self, sov_metrics: Dict, processed_data: Dict) -> Dict:
         """Generate actionable insights from the analysis"""
         insights = {
@@ -149,7 +230,8 @@ class AtombergSoVAgent:
             )
         
         # Sentiment analysis insights
-        sentiment_score = sov_metrics.get('sentiment_share', {}).get('positive', 0)
+        sentiment_share = sov_metrics.get('sentiment_share') or {}
+        sentiment_score = sentiment_share.get('positive', 0)
         if sentiment_score > 0.7:
             insights['key_findings'].append(
                 "Positive brand sentiment: Most Atomberg mentions are positive"
@@ -164,61 +246,229 @@ class AtombergSoVAgent:
             ])
         
         # Platform-specific insights
-        platform_performance = sov_metrics.get('platform_breakdown', {})
-        best_platform = max(platform_performance.items(), key=lambda x: x[1]) if platform_performance else None
-        if best_platform:
+        platform_performance = sov_metrics.get('platform_breakdown') or {}
+        if platform_performance:
+            best_platform = max(platform_performance, key=platform_performance.get)
+            best_sov = platform_performance[best_platform]
             insights['key_findings'].append(
-                f"Best performing platform: {best_platform[0]} ({best_platform[1]:.2%} SoV)"
+                f"Best performing platform: {best_platform} ({best_sov:.2%} SoV)"
             )
             insights['marketing_recommendations'].append(
-                f"Invest more resources in {best_platform[0]} content and engagement"
+                f"Invest more resources in {best_platform} content and engagement"
             )
         
         return insights
     
-    def _save_results(self, results: Dict):
-        """Save analysis results to files"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    def _save_results(self, results: Dict, processed_data: Dict, timestamp: Optional[str] = None) -> Optional[Dict]:
+        """
+        Save analysis results to files
+        
+        Returns:
+            Reference to the raw posts sidecar, or None if the posts were embedded in the JSON
+        """
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Create output directories
         os.makedirs('data', exist_ok=True)
         os.makedirs('reports', exist_ok=True)
         
-        # Save raw data as JSON
-        import json
-        with open(f'data/sov_analysis_{timestamp}.json', 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        # Spill raw posts to a Parquet sidecar; the JSON keeps only a reference
+        raw_data_ref = self._save_raw_data(processed_data, timestamp)
+        if raw_data_ref:
+            results['raw_data_ref'] = raw_data_ref
+        else:
+            results['raw_data'] = processed_data
+        
+        # Save raw data as JSON (zstd-compressed unless disabled or unavailable)
+        results_path = f'data/sov_analysis_{timestamp}.json'
+        if orjson is not None:
+            payload = orjson.dumps(
+                results,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                default=str
+            )
+        else:
+            payload = json.dumps(results, indent=2, default=str).encode('utf-8')
+        
+        if self.compress_results and zstandard is not None:
+            results_path += '.zst'
+            with open(results_path, 'wb', buffering=WRITE_BUFFER_SIZE) as raw, \
+                    zstandard.ZstdCompressor(level=3).stream_writer(raw) as f:
+                f.write(payload)
+        else:
+            with open(results_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(payload)
         
-        # Save metrics as CSV
+        # Save metrics as CSV, rendered in memory and written in one shot
         import pandas as pd
         metrics_df = pd.DataFrame([results['sov_metrics']])
-        metrics_df.to_csv(f'data/sov_metrics_{timestamp}.csv', index=False)
+        csv_text = metrics_df.to_csv(index=False)
+        with open(f'data/sov_metrics_{timestamp}.csv', 'w', encoding='utf-8',
+                  buffering=WRITE_BUFFER_SIZE, newline='') as f:
+            f.write(csv_text)
+        
+        logger.info(f"Results saved to {results_path}")
+        return raw_data_ref
+    
+    def _save_charts(self, charts: Dict[str, str], timestamp: str):
+        """Save the chart paths next to the results saved under the same timestamp"""
+        charts_path = f'data/sov_charts_{timestamp}.json'
+        with open(charts_path, 'w') as f:
+            json.dump(charts, f, indent=2)
+        logger.info(f"Chart index saved to {charts_path}")
+    
+    def _save_raw_data(self, processed_data: Dict, timestamp: str) -> Optional[Dict]:
+        """
+        Write processed posts to data/raw_<timestamp>.parquet
+        
+        Returns:
+            Reference to the sidecar file, or None when the posts stay embedded
+            in the JSON (no posts, or the Parquet export failed)
+        """
+        rows = [
+            {'keyword': keyword, **post, 'platform': platform}
+            for keyword, keyword_data in processed_data.items()
+            for platform, posts in keyword_data.items()
+            for post in posts
+        ]
+        if not rows:
+            return None
+        
+        # Fields each platform's posts carry, so the loader can tell a post's own null
+        # fields from the columns of other platforms
+        fields_by_platform: Dict[str, Dict[str, None]] = {}
+        for row in rows:
+            # Twitter API ids are ints, every other platform uses strings
+            if row.get('id') is not None:
+                row['id'] = str(row['id'])
+            fields_by_platform.setdefault(row['platform'], {}).update(dict.fromkeys(row))
+        
+        # Union of all platforms' fields, in first-seen order. Built with pyarrow directly
+        # rather than through pandas, which would turn sparse int columns into float64.
+        columns = list(dict.fromkeys(field for fields in fields_by_platform.values() for field in fields))
+        
+        parquet_path = f'data/raw_{timestamp}.parquet'
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.table({field: [row.get(field) for row in rows] for field in columns})
+            pq.write_table(table, parquet_path, compression='zstd')
+            
+            # The footer alone confirms the file holds every row and column
+            metadata = pq.read_metadata(parquet_path)
+            if metadata.num_rows != len(rows) or metadata.schema.to_arrow_schema().names != columns:
+                os.remove(parquet_path)
+                raise ValueError("written file does not match the posts")
+        except Exception as e:
+            logger.warning(f"Keeping raw data inline, Parquet export failed: {e}")
+            return None
         
-        logger.info(f"Results saved to data/sov_analysis_{timestamp}.json")
+        return {
+            'path': parquet_path,
+            'n_rows': table.num_rows,
+            'schema': columns,
+            'fields': {platform: list(fields) for platform, fields in fields_by_platform.items()}
+        }
+
+def load_results(timestamp: str) -> Dict:
+    """
+    Load results saved by AtombergSoVAgent
+    
+    Args:
+        timestamp: Timestamp suffix of the saved files (e.g. '20250807_093031')
+        
+    Returns:
+        Results dictionary; raw posts stay in the sidecar referenced by 'raw_data_ref'
+    """
+    results_path = f'data/sov_analysis_{timestamp}.json'
+    if os.path.exists(f'{results_path}.zst'):
+        if zstandard is None:
+            raise ImportError(
+                f"{results_path}.zst is zstd-compressed; install the 'zstandard' package to read it"
+            )
+        with open(f'{results_path}.zst', 'rb') as f:
+            payload = zstandard.ZstdDecompressor().stream_reader(f).read()
+    else:
+        with open(results_path, 'rb') as f:
+            payload = f.read()
+    results = json.loads(payload)
+    
+    charts_path = f'data/sov_charts_{timestamp}.json'
+    if os.path.exists(charts_path):
+        with open(charts_path) as f:
+            results['visualizations'] = json.load(f)
+    
+    return results
+
+def load_raw_data(results: Dict) -> Dict:
+    """
+    Return the raw posts of an analysis, reading the Parquet sidecar if needed
+    
+    Args:
+        results: Results returned by analyze_sov or load_results
+        
+    Returns:
+        Raw posts organized by keyword and platform
+    """
+    if 'raw_data' in results:
+        return results['raw_data']
+    
+    raw_data = {}
+    for post in _read_raw_rows(results['raw_data_ref']):
+        keyword = post.pop('keyword')
+        raw_data.setdefault(keyword, {}).setdefault(post['platform'], []).append(post)
+    
+    return raw_data
+
+def _read_raw_rows(raw_data_ref: Dict) -> List[Dict]:
+    """Read the rows of a raw posts sidecar, keeping only the fields of each row's platform"""
+    import pyarrow.parquet as pq
+    
+    fields_by_platform = raw_data_ref['fields']
+    return [
+        {field: record[field] for field in fields_by_platform[record['platform']]}
+        for record in pq.read_table(raw_data_ref['path']).to_pylist()
+    ]
+
+def _csv_list(value: str) -> Tuple[str, ...]:
+    """argparse type that splits a comma-separated option into a tuple of items"""
+    items = tuple(item.strip() for item in value.split(',') if item.strip())
+    if not items:
+        raise argparse.ArgumentTypeError("expected at least one comma-separated value")
+    return items
 
 def main():
     """Main function"""
     parser = argparse.ArgumentParser(description='Atomberg Share of Voice Analysis Agent')
-    parser.add_argument('--keywords', type=str, default='smart fan', 
+    parser.add_argument('--keywords', type=_csv_list, default='smart fan', 
                        help='Comma-separated keywords to analyze')
-    parser.add_argument('--platforms', type=str, default='youtube,twitter', 
+    parser.add_argument('--platforms', type=_csv_list, default='youtube,twitter', 
                        help='Comma-separated platforms to search')
     parser.add_argument('--results', type=int, default=50, 
                        help='Number of results to analyze per platform')
     parser.add_argument('--config', type=str, default='config/settings.py',
                        help='Path to configuration file')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore cached search results and query every platform, and '
+                            'redraw the dashboard charts instead of reusing ones with identical metrics')
+    parser.add_argument('--uncompressed', action='store_true',
+                       help='Save results as plain JSON instead of zstd-compressed JSON')
     
     args = parser.parse_args()
     
-    # Parse arguments
-    keywords = [k.strip() for k in args.keywords.split(',')]
-    platforms = [p.strip() for p in args.platforms.split(',')]
+    # Parsed into tuples by _csv_list, so they can be used as cache keys as-is
+    keywords = args.keywords
+    platforms = args.platforms
     
     # Load configuration
-    config = Config()
+    config = load_config()
     
     # Initialize and run agent
-    agent = AtombergSoVAgent(config)
+    agent = AtombergSoVAgent(
+        config,
+        use_cache=not args.no_cache,
+        compress_results=not args.uncompressed
+    )
     
     try:
         results = agent.analyze_sov(
@@ -41,6 +41,30 @@ def setup_directories():
         os.makedirs(directory, exist_ok=True)
         print(f"   ✅ {directory}/")
 
+def compile_extensions():
+    """Optionally compile the standalone demo to a C extension with mypyc"""
+    print("⚙️  Compiling standalone_demo.py with mypyc...")
+    
+    try:
+        result = subprocess.run(
+            [sys.executable, '-m', 'mypyc', 'standalone_demo.py'],
+            capture_output=True, text=True
+        )
+    except OSError as e:
+        print(f"   ❌ Could not run mypyc: {e}")
+        return
+    
+    if result.returncode == 0:
+        print("   ✅ standalone_demo compiled")
+        print("      Run it with: python3 -c \"import standalone_demo; standalone_demo.main()\"")
+        print("      (the .py file is used if the extension is removed)")
+    elif "No module named mypyc" in result.stderr:
+        print("   ❌ mypyc is not installed - install it with 'pip install mypy' to enable")
+    else:
+        print("   ❌ mypyc compilation failed:")
+        # mypy reports type errors on stdout, build errors go to stderr
+        print((result.stdout + result.stderr).rstrip())
+
 def check_environment():
     """Check Python environment"""
     print("🐍 Checking Python environment...")
@@ -55,6 +79,10 @@ def main():
     check_environment()
     setup_directories()
     
+    # Opt-in: python setup.py --compile
+    if '--compile' in sys.argv:
+        compile_extensions()
+    
     print("\n✨ Setup completed!")
     print("\nNext steps:")
     print("1. Run demo: python demo.py")
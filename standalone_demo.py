@@ -5,11 +5,120 @@ This version works without external dependencies for demonstration
 """
 
 import json
-import os
+import re
+import sys
+from functools import lru_cache
+from array import array
 from datetime import datetime
-from typing import Dict, List, Any
-from collections import defaultdict
+from pathlib import Path
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Final, FrozenSet, List, Tuple, Type, TypeVar, cast
 import random
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: faster JSON encoding when available; the demo still runs on the stdlib alone
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Fixed platform order; posts carry an index into this tuple so per-platform
+# tallies are list slots rather than string-keyed dict entries
+PLATFORMS: Final[Tuple[str, ...]] = ('youtube', 'twitter', 'google')
+PLATFORM_IDX: Final[Dict[str, int]] = {platform: i for i, platform in enumerate(PLATFORMS)}
+
+DATA_DIR: Final = Path('data')
+REPORTS_DIR: Final = Path('reports')
+_DIRS_READY: bool = False  # Set once the output directories have been created in this process
+
+def _ensure_output_dirs() -> None:
+    """Create the output directories on first use only"""
+    global _DIRS_READY
+    if not _DIRS_READY:
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+        _DIRS_READY = True
+
+_T = TypeVar('_T')
+
+def _slotted(cls: Type[_T]) -> Type[_T]:
+    """
+    Rebuild a dataclass with __slots__ for the fields it declares
+    
+    Equivalent to dataclass(slots=True), which needs Python 3.10. Declaring __slots__
+    in the class body instead breaks under mypyc, whose dataclass support reads the
+    slot descriptors as field defaults.
+    """
+    namespace = {
+        name: value for name, value in vars(cls).items()
+        if name not in ('__dict__', '__weakref__')
+    }
+    namespace['__slots__'] = tuple(vars(cls).get('__annotations__', {}))
+    return cast(Type[_T], type(cls.__name__, cls.__bases__, namespace))
+
+@_slotted
+@dataclass
+class Post:
+    """Fields shared by every mock post (slotted: no per-record __dict__)"""
+    platform: str
+    id: str
+    mentions_atomberg: bool
+    mentions_competitors: List[str]
+    text_content: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form for JSON output"""
+        return asdict(self)
+
+@_slotted
+@dataclass
+class YouTubePost(Post):
+    title: str
+    description: str
+    channel: str
+    published_at: str
+    url: str
+    views: int
+    likes: int
+    comments: int
+
+@_slotted
+@dataclass
+class TwitterPost(Post):
+    text: str
+    author: str
+    author_followers: int
+    retweets: int
+    likes: int
+    replies: int
+
+@_slotted
+@dataclass
+class GooglePost(Post):
+    title: str
+    description: str
+    url: str
+    position: int
+    page: int
+    domain: str
+
+@dataclass
+class PostTable:
+    """Column-oriented copy of the post fields the SoV calculation reads"""
+    mentions_atomberg: array = field(default_factory=lambda: array('B'))
+    n_competitors: array = field(default_factory=lambda: array('B'))
+    ids: List[str] = field(default_factory=list)
+    platform_idx: array = field(default_factory=lambda: array('B'))
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def extend(self, posts: List[Post]):
+        """Append a batch of posts, one column at a time"""
+        self.mentions_atomberg.extend(post.mentions_atomberg for post in posts)
+        self.n_competitors.extend(len(post.mentions_competitors) for post in posts)
+        self.ids.extend(post.id for post in posts)
+        self.platform_idx.extend(PLATFORM_IDX[post.platform] for post in posts)
 
 class MockDataGenerator:
     """Generates realistic mock data for demonstration"""
@@ -17,6 +126,10 @@ class MockDataGenerator:
     def __init__(self):
         self.competitors = ['Havells', 'Orient', 'Bajaj', 'Crompton', 'Usha']
         
+        # Single pass brand detection; the brand list is data, not a chain of `in` checks
+        brands = ['atomberg'] + [comp.lower() for comp in self.competitors]
+        self._brand_re = re.compile(r'\b(' + '|'.join(map(re.escape, brands)) + r')\b')
+        
         self.youtube_titles = [
             "Best Smart Ceiling Fans 2024 - Atomberg vs Havells Comparison",
             "Smart Fan Review: Energy Efficient BLDC Motors Explained",
@@ -65,123 +178,151 @@ class MockDataGenerator:
             ("Smart Ceiling Fan Troubleshooting Guide | Common Issues",
              "Fix common smart fan problems. Atomberg, Havells, Orient troubleshooting tips and customer support contacts.")
         ]
+        
+        # The corpora are fixed, so brand mentions are scanned once here rather than on every call
+        # (@handles match too: '@' is a word boundary). Posts get their own copy of the competitor
+        # list so callers cannot mutate the cached one.
+        self._yt_prepared = [(title, *self._scan_brands(title)) for title in self.youtube_titles]
+        self._tw_prepared = [(text, *self._scan_brands(text)) for text in self.twitter_texts]
+        self._g_prepared = [
+            (title, description, *self._scan_brands(f"{title} {description}"))
+            for title, description in self.google_results
+        ]
+    
+    def _scan_brands(self, text: str) -> Tuple[bool, List[str]]:
+        """Return (mentions_atomberg, competitor_mentions) from one scan of the text"""
+        hits = set(self._brand_re.findall(text.lower()))
+        return 'atomberg' in hits, [comp for comp in self.competitors if comp.lower() in hits]
+    
+    @staticmethod
+    def _random_column(low: int, high: int, n: int) -> List[int]:
+        """Draw n uniform integers in [low, high] in one call"""
+        return random.choices(range(low, high + 1), k=n)
     
-    def generate_youtube_data(self, query: str, max_results: int) -> List[Dict]:
+    def generate_youtube_data(self, query: str, max_results: int) -> List[Post]:
         """Generate mock YouTube data"""
-        results = []
-        for i in range(min(max_results, len(self.youtube_titles))):
-            title = self.youtube_titles[i]
-            
-            # Determine brand mentions
-            mentions_atomberg = 'atomberg' in title.lower()
-            competitor_mentions = [comp for comp in self.competitors if comp.lower() in title.lower()]
-            
-            result = {
-                'platform': 'youtube',
-                'id': f'yt_mock_{i}',
-                'title': title,
-                'description': f'Detailed analysis and review of {title.split()[0]} with technical specifications and user experience.',
-                'channel': f'TechReviewer{i+1}',
-                'published_at': '2024-01-01T00:00:00Z',
-                'url': f'https://youtube.com/watch?v=mock_{i}',
-                'views': random.randint(5000, 50000),
-                'likes': random.randint(100, 1000),
-                'comments': random.randint(20, 200),
-                'mentions_atomberg': mentions_atomberg,
-                'mentions_competitors': competitor_mentions,
-                'text_content': title
-            }
-            results.append(result)
-        
-        return results
+        n = min(max_results, len(self.youtube_titles))
+        views = self._random_column(5000, 50000, n)
+        likes = self._random_column(100, 1000, n)
+        comments = self._random_column(20, 200, n)
+        return [
+            YouTubePost(
+                platform='youtube',
+                id=sys.intern(f'yt_mock_{i}'),
+                title=title,
+                description=f'Detailed analysis and review of {title.split()[0]} with technical specifications and user experience.',
+                channel=f'TechReviewer{i+1}',
+                published_at='2024-01-01T00:00:00Z',
+                url=f'https://youtube.com/watch?v=mock_{i}',
+                views=views[i],
+                likes=likes[i],
+                comments=comments[i],
+                mentions_atomberg=mentions_atomberg,
+                mentions_competitors=list(competitor_mentions),
+                text_content=title
+            )
+            for i, (title, mentions_atomberg, competitor_mentions) in enumerate(self._yt_prepared[:n])
+        ]
     
-    def generate_twitter_data(self, query: str, max_results: int) -> List[Dict]:
+    def generate_twitter_data(self, query: str, max_results: int) -> List[Post]:
         """Generate mock Twitter data"""
-        results = []
-        for i in range(min(max_results, len(self.twitter_texts))):
-            text = self.twitter_texts[i]
-            
-            # Determine brand mentions
-            mentions_atomberg = 'atomberg' in text.lower() or '@atomberg' in text.lower()
-            competitor_mentions = []
-            for comp in self.competitors:
-                if comp.lower() in text.lower() or f'@{comp.lower()}' in text.lower():
-                    competitor_mentions.append(comp)
-            
-            result = {
-                'platform': 'twitter',
-                'id': f'tw_mock_{i}',
-                'text': text,
-                'author': f'user_{i+1}',
-                'author_followers': random.randint(500, 5000),
-                'retweets': random.randint(1, 50),
-                'likes': random.randint(5, 200),
-                'replies': random.randint(0, 30),
-                'mentions_atomberg': mentions_atomberg,
-                'mentions_competitors': competitor_mentions,
-                'text_content': text
-            }
-            results.append(result)
-        
-        return results
+        n = min(max_results, len(self.twitter_texts))
+        followers = self._random_column(500, 5000, n)
+        retweets = self._random_column(1, 50, n)
+        likes = self._random_column(5, 200, n)
+        replies = self._random_column(0, 30, n)
+        return [
+            TwitterPost(
+                platform='twitter',
+                id=sys.intern(f'tw_mock_{i}'),
+                text=text,
+                author=f'user_{i+1}',
+                author_followers=followers[i],
+                retweets=retweets[i],
+                likes=likes[i],
+                replies=replies[i],
+                mentions_atomberg=mentions_atomberg,
+                mentions_competitors=list(competitor_mentions),
+                text_content=text
+            )
+            for i, (text, mentions_atomberg, competitor_mentions) in enumerate(self._tw_prepared[:n])
+        ]
     
-    def generate_google_data(self, query: str, max_results: int) -> List[Dict]:
+    def generate_google_data(self, query: str, max_results: int) -> List[Post]:
         """Generate mock Google search data"""
-        results = []
-        for i, (title, description) in enumerate(self.google_results[:max_results]):
-            
-            # Determine brand mentions
-            full_text = f"{title} {description}"
-            mentions_atomberg = 'atomberg' in full_text.lower()
-            competitor_mentions = [comp for comp in self.competitors if comp.lower() in full_text.lower()]
-            
-            result = {
-                'platform': 'google',
-                'id': f'google_mock_{i}',
-                'title': title,
-                'description': description,
-                'url': f'https://example{i}.com/smart-fans',
-                'position': i + 1,
-                'page': (i // 10) + 1,
-                'mentions_atomberg': mentions_atomberg,
-                'mentions_competitors': competitor_mentions,
-                'text_content': full_text,
-                'domain': f'example{i}.com'
-            }
-            results.append(result)
-        
-        return results
+        prepared = self._g_prepared[:max_results]
+        return [
+            GooglePost(
+                platform='google',
+                id=sys.intern(f'google_mock_{i}'),
+                title=title,
+                description=description,
+                url=f'https://example{i}.com/smart-fans',
+                position=i + 1,
+                page=(i // 10) + 1,
+                mentions_atomberg=mentions_atomberg,
+                mentions_competitors=list(competitor_mentions),
+                text_content=f"{title} {description}",
+                domain=f'example{i}.com'
+            )
+            for i, (title, description, mentions_atomberg, competitor_mentions) in enumerate(prepared)
+        ]
+
+def _compile_word_pattern(words: FrozenSet[str]) -> re.Pattern:
+    """Compile a case-insensitive whole-word alternation"""
+    alternation = '|'.join(map(re.escape, sorted(words)))
+    # The word lists are plain ASCII, so ASCII-only case folding and \b classes suffice
+    return re.compile(rf'\b(?:{alternation})\b', re.IGNORECASE | re.ASCII)
+
+POSITIVE_WORDS: Final[FrozenSet[str]] = frozenset({
+    'amazing', 'excellent', 'great', 'fantastic', 'wonderful', 'awesome',
+    'best', 'love', 'perfect', 'outstanding', 'brilliant', 'good',
+    'efficient', 'quiet', 'smooth', 'reliable', 'durable', 'recommend'
+})
+
+NEGATIVE_WORDS: Final[FrozenSet[str]] = frozenset({
+    'terrible', 'awful', 'bad', 'horrible', 'worst', 'hate',
+    'broken', 'problem', 'issue', 'disappointing', 'noisy', 'expensive'
+})
+
+# One compiled alternation per polarity, so each text is scanned by the
+# regex engine instead of being split and looked up word by word
+_POSITIVE_RE: Final = _compile_word_pattern(POSITIVE_WORDS)
+_NEGATIVE_RE: Final = _compile_word_pattern(NEGATIVE_WORDS)
+
+@lru_cache(maxsize=2048)
+def _score_text(text: str) -> Tuple[int, int]:
+    """Return (positive, negative) word counts; memoized since the mock corpora repeat"""
+    return len(_POSITIVE_RE.findall(text)), len(_NEGATIVE_RE.findall(text))
 
 class SimpleSentimentAnalyzer:
     """Simple sentiment analyzer using word lists"""
     
     def __init__(self):
-        self.positive_words = {
-            'amazing', 'excellent', 'great', 'fantastic', 'wonderful', 'awesome',
-            'best', 'love', 'perfect', 'outstanding', 'brilliant', 'good',
-            'efficient', 'quiet', 'smooth', 'reliable', 'durable', 'recommend'
-        }
-        
-        self.negative_words = {
-            'terrible', 'awful', 'bad', 'horrible', 'worst', 'hate',
-            'broken', 'problem', 'issue', 'disappointing', 'noisy', 'expensive'
-        }
+        self.positive_words = POSITIVE_WORDS
+        self.negative_words = NEGATIVE_WORDS
+    
+    def is_positive(self, text: str) -> bool:
+        """Check whether text scores positive, without building the full result"""
+        if not text:
+            return False
+        positive_score, negative_score = _score_text(text)
+        return positive_score > negative_score
     
-    def analyze_text(self, text: str) -> Dict:
+    def analyze_text(self, text: str) -> Dict[str, Any]:
         """Analyze sentiment of text"""
         if not text:
             return {'sentiment': 'neutral', 'confidence': 0.0}
         
-        words = text.lower().split()
-        positive_score = sum(1 for word in words if word in self.positive_words)
-        negative_score = sum(1 for word in words if word in self.negative_words)
+        positive_score, negative_score = _score_text(text)
+        word_count = text.count(' ') + 1
         
         if positive_score > negative_score:
             sentiment = 'positive'
-            confidence = positive_score / len(words)
+            confidence = positive_score / word_count
         elif negative_score > positive_score:
             sentiment = 'negative'
-            confidence = negative_score / len(words)
+            confidence = negative_score / word_count
         else:
             sentiment = 'neutral'
             confidence = 0.5
@@ -196,45 +337,51 @@ class SimpleSentimentAnalyzer:
 class SimpleSoVCalculator:
     """Simple Share of Voice calculator"""
     
-    def calculate_sov(self, processed_data: Dict, sentiment_data: Dict) -> Dict:
-        """Calculate SoV metrics"""
-        # Flatten all posts
-        all_posts = []
-        for keyword_data in processed_data.values():
-            for platform_data in keyword_data.values():
-                all_posts.extend(platform_data)
+    def calculate_sov(self, posts: PostTable, sent_is_pos: bytearray) -> Dict[str, Any]:
+        """
+        Calculate SoV metrics
         
-        if not all_posts:
-            return self._empty_metrics()
+        Args:
+            posts: Post table
+            sent_is_pos: Positive-sentiment flags, aligned with the table rows
         
-        # Calculate mention share
-        atomberg_mentions = sum(1 for post in all_posts if post.get('mentions_atomberg', False))
-        competitor_mentions = sum(len(post.get('mentions_competitors', [])) for post in all_posts)
-        total_brand_mentions = atomberg_mentions + competitor_mentions
+        Returns:
+            SoV metrics
+        """
+        total_posts: int = len(posts)
+        if not total_posts:
+            return self._empty_metrics()
         
-        mention_share = atomberg_mentions / max(total_brand_mentions, 1)
+        # Column sums run over packed byte arrays
+        atomberg_mentions: int = sum(posts.mentions_atomberg)
+        competitor_mentions: int = sum(posts.n_competitors)
+        positive_atomberg: int = 0
+        mentions = posts.mentions_atomberg
+        for i in range(total_posts):
+            positive_atomberg += mentions[i] & sent_is_pos[i]
         
-        # Calculate sentiment metrics
-        atomberg_posts = [post for post in all_posts if post.get('mentions_atomberg', False)]
-        positive_atomberg = 0
-        total_atomberg_sentiment = 0
+        # Per platform: [posts, atomberg mentions, all brand mentions]
+        platform_counts: List[List[int]] = [[0, 0, 0] for _ in PLATFORMS]
+        for pi, mentions_atomberg, n_competitors in zip(
+                posts.platform_idx, posts.mentions_atomberg, posts.n_competitors):
+            counts = platform_counts[pi]
+            counts[0] += 1
+            counts[1] += mentions_atomberg
+            counts[2] += mentions_atomberg + n_competitors
         
-        for post in atomberg_posts:
-            post_sentiment = sentiment_data.get(post['id'], {})
-            if post_sentiment.get('sentiment') == 'positive':
-                positive_atomberg += 1
-            total_atomberg_sentiment += 1
+        # Mention share
+        total_brand_mentions = atomberg_mentions + competitor_mentions
+        mention_share = atomberg_mentions / max(total_brand_mentions, 1)
         
-        sentiment_ratio = positive_atomberg / max(total_atomberg_sentiment, 1)
+        # Sentiment metrics (share of Atomberg posts that are positive)
+        sentiment_ratio = positive_atomberg / max(atomberg_mentions, 1)
         
         # Platform breakdown
-        platform_breakdown = {}
-        for keyword_data in processed_data.values():
-            for platform, posts in keyword_data.items():
-                if posts:
-                    platform_atomberg = sum(1 for post in posts if post.get('mentions_atomberg', False))
-                    platform_total = sum(len(post.get('mentions_competitors', [])) for post in posts) + platform_atomberg
-                    platform_breakdown[platform] = platform_atomberg / max(platform_total, 1)
+        platform_breakdown = {
+            platform: platform_atomberg / max(platform_total, 1)
+            for platform, (n_posts, platform_atomberg, platform_total) in zip(PLATFORMS, platform_counts)
+            if n_posts
+        }
         
         # Overall SoV (weighted average)
         overall_sov = (mention_share * 0.6) + (sentiment_ratio * 0.4)
@@ -256,12 +403,12 @@ class SimpleSoVCalculator:
                 }
             },
             'platform_breakdown': platform_breakdown,
-            'total_posts_analyzed': len(all_posts),
+            'total_posts_analyzed': total_posts,
             'atomberg_mentions': atomberg_mentions,
             'competitor_mentions': competitor_mentions
         }
     
-    def _empty_metrics(self):
+    def _empty_metrics(self) -> Dict[str, Any]:
         return {
             'overall_sov': 0.0,
             'mention_share': {'atomberg': 0.0, 'total_mentions': 0},
@@ -281,10 +428,11 @@ def run_standalone_demo():
     data_generator = MockDataGenerator()
     sentiment_analyzer = SimpleSentimentAnalyzer()
     sov_calculator = SimpleSoVCalculator()
+    post_table = PostTable()
     
     # Demo parameters
     keywords = ["smart fan"]
-    platforms = ["youtube", "twitter", "google"]
+    platforms = list(PLATFORMS)
     max_results = 10
     
     print(f"📊 Demo Parameters:")
@@ -295,45 +443,55 @@ def run_standalone_demo():
     # Step 1: Generate mock data
     print(f"\n🔍 Step 1: Generating mock data...")
     all_results = {}
+    generators = {
+        'youtube': data_generator.generate_youtube_data,
+        'twitter': data_generator.generate_twitter_data,
+        'google': data_generator.generate_google_data,
+    }
     
-    for keyword in keywords:
-        keyword_results = {}
-        for platform in platforms:
-            print(f"   - Generating {platform} data for '{keyword}'...")
+    # Platforms share no state, so each keyword's platforms are generated concurrently;
+    # results are collected in platform order to keep the post table rows deterministic
+    with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+        for keyword in keywords:
+            futures = {
+                platform: executor.submit(generators[platform], keyword, max_results)
+                for platform in platforms if platform in generators
+            }
             
-            if platform == 'youtube':
-                platform_data = data_generator.generate_youtube_data(keyword, max_results)
-            elif platform == 'twitter':
-                platform_data = data_generator.generate_twitter_data(keyword, max_results)
-            elif platform == 'google':
-                platform_data = data_generator.generate_google_data(keyword, max_results)
-            else:
-                platform_data = []
+            keyword_results = {}
+            for platform in platforms:
+                print(f"   - Generating {platform} data for '{keyword}'...")
+                future = futures.get(platform)
+                platform_data = future.result() if future else []
+                
+                keyword_results[platform] = platform_data
+                post_table.extend(platform_data)
+                print(f"     ✅ Generated {len(platform_data)} posts")
             
-            keyword_results[platform] = platform_data
-            print(f"     ✅ Generated {len(platform_data)} posts")
-        
-        all_results[keyword] = keyword_results
+            all_results[keyword] = keyword_results
     
     # Step 2: Sentiment analysis
     print(f"\n😊 Step 2: Performing sentiment analysis...")
-    sentiment_results = {}
-    total_posts = 0
+    # Flags are stored by row position, in the same order the posts were added to the table.
+    # SoV only reads sentiment for Atomberg posts, so the rest keep the zero default.
+    total_posts = len(post_table)
+    sent_is_pos = bytearray(total_posts)
+    analyzed_posts = 0
+    i = 0
     
     for keyword_data in all_results.values():
         for platform_data in keyword_data.values():
             for post in platform_data:
-                post_id = post['id']
-                text_content = post.get('text_content', '')
-                sentiment_result = sentiment_analyzer.analyze_text(text_content)
-                sentiment_results[post_id] = sentiment_result
-                total_posts += 1
+                if post.mentions_atomberg:
+                    sent_is_pos[i] = sentiment_analyzer.is_positive(post.text_content)
+                    analyzed_posts += 1
+                i += 1
     
-    print(f"   ✅ Analyzed sentiment for {total_posts} posts")
+    print(f"   ✅ Analyzed sentiment for {analyzed_posts} of {total_posts} posts (Atomberg mentions)")
     
     # Step 3: Calculate SoV
     print(f"\n📈 Step 3: Calculating Share of Voice metrics...")
-    sov_metrics = sov_calculator.calculate_sov(all_results, sentiment_results)
+    sov_metrics = sov_calculator.calculate_sov(post_table, sent_is_pos)
     overall_sov = sov_metrics.get('overall_sov', 0)
     print(f"   ✅ Overall Atomberg SoV: {overall_sov:.2%}")
     
@@ -347,8 +505,7 @@ def run_standalone_demo():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     # Create directories
-    os.makedirs('data', exist_ok=True)
-    os.makedirs('reports', exist_ok=True)
+    _ensure_output_dirs()
     
     # Save detailed results
     results = {
@@ -362,44 +519,51 @@ def run_standalone_demo():
         'sov_metrics': sov_metrics,
         'insights': insights,
         'sample_data': {
-            platform: data[:3] for platform, data in all_results['smart fan'].items()
+            platform: [post.to_dict() for post in data[:3]]
+            for platform, data in all_results['smart fan'].items()
         }
     }
     
-    results_file = f'data/standalone_demo_{timestamp}.json'
-    with open(results_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    results_file = DATA_DIR / f'standalone_demo_{timestamp}.json'
+    if orjson is not None:
+        with open(results_file, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                                 default=str))
+    else:
+        with open(results_file, 'w') as f:
+            json.dump(results, f, indent=2, default=str)
     
-    # Create text report
-    report_file = f'reports/demo_report_{timestamp}.txt'
-    with open(report_file, 'w') as f:
-        f.write("ATOMBERG SHARE OF VOICE ANALYSIS - DEMO REPORT\n")
-        f.write("=" * 55 + "\n\n")
-        
-        f.write("EXECUTIVE SUMMARY\n")
-        f.write("-" * 20 + "\n")
-        f.write(f"Overall Share of Voice: {overall_sov:.2%}\n")
-        f.write(f"Total Posts Analyzed: {total_posts}\n")
-        f.write(f"Atomberg Mentions: {sov_metrics.get('atomberg_mentions', 0)}\n")
-        f.write(f"Competitor Mentions: {sov_metrics.get('competitor_mentions', 0)}\n\n")
-        
-        f.write("PLATFORM BREAKDOWN\n")
-        f.write("-" * 20 + "\n")
-        platform_breakdown = sov_metrics.get('platform_breakdown', {})
-        for platform, sov in platform_breakdown.items():
-            f.write(f"{platform.title()}: {sov:.2%}\n")
-        f.write("\n")
+    # Create text report (assembled in memory and written in one call)
+    report_file = REPORTS_DIR / f'demo_report_{timestamp}.txt'
+    platform_breakdown = sov_metrics.get('platform_breakdown', {})
+    parts = [
+        "ATOMBERG SHARE OF VOICE ANALYSIS - DEMO REPORT\n",
+        "=" * 55 + "\n\n",
         
-        f.write("KEY INSIGHTS\n")
-        f.write("-" * 15 + "\n")
-        for i, insight in enumerate(insights.get('key_findings', []), 1):
-            f.write(f"{i}. {insight}\n")
-        f.write("\n")
+        "EXECUTIVE SUMMARY\n",
+        "-" * 20 + "\n",
+        f"Overall Share of Voice: {overall_sov:.2%}\n",
+        f"Total Posts Analyzed: {total_posts}\n",
+        f"Atomberg Mentions: {sov_metrics.get('atomberg_mentions', 0)}\n",
+        f"Competitor Mentions: {sov_metrics.get('competitor_mentions', 0)}\n\n",
         
-        f.write("RECOMMENDATIONS\n")
-        f.write("-" * 18 + "\n")
-        for i, rec in enumerate(insights.get('recommendations', []), 1):
-            f.write(f"{i}. {rec}\n")
+        "PLATFORM BREAKDOWN\n",
+        "-" * 20 + "\n",
+    ]
+    parts.extend(f"{platform.title()}: {sov:.2%}\n" for platform, sov in platform_breakdown.items())
+    parts.append("\n")
+    
+    parts.append("KEY INSIGHTS\n")
+    parts.append("-" * 15 + "\n")
+    parts.extend(f"{i}. {insight}\n" for i, insight in enumerate(insights.get('key_findings', []), 1))
+    parts.append("\n")
+    
+    parts.append("RECOMMENDATIONS\n")
+    parts.append("-" * 18 + "\n")
+    parts.extend(f"{i}. {rec}\n" for i, rec in enumerate(insights.get('recommendations', []), 1))
+    
+    with open(report_file, 'w') as f:
+        f.write("".join(parts))
     
     print(f"   ✅ Results saved to {results_file}")
     print(f"   ✅ Report saved to {report_file}")
@@ -432,7 +596,7 @@ def run_standalone_demo():
 
 def generate_insights(sov_metrics: Dict) -> Dict:
     """Generate insights from SoV metrics"""
-    insights = {
+    insights: Dict[str, Any] = {
         'key_findings': [],
         'recommendations': []
     }
@@ -480,7 +644,8 @@ def generate_insights(sov_metrics: Dict) -> Dict:
     
     return insights
 
-if __name__ == "__main__":
+def main():
+    """Run the demo (also the entry point of the mypyc-compiled module)"""
     try:
         run_standalone_demo()
     except KeyboardInterrupt:
@@ -489,3 +654,6 @@ if __name__ == "__main__":
         print(f"\n\n❌ Demo failed: {str(e)}")
         import traceback
         traceback.print_exc()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Search Cache - On-disk memoization of platform search results
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+class SearchCache:
+    """Content-addressed cache for search results keyed by (platform, query, max_results)"""
+    
+    def __init__(self, cache_dir: str = 'data/.search_cache', ttl: int = 86400):
+        self.cache_dir = cache_dir
+        self.ttl = ttl  # Seconds before a cached entry is considered stale
+        self.suffix = '.pkl.zst' if zstandard else '.pkl'
+    
+    def _path(self, platform: str, query: str, max_results: int) -> str:
+        """Build the cache file path for a search"""
+        key = f"{platform}|{query}|{max_results}".encode('utf-8')
+        digest = hashlib.blake2b(key, digest_size=8).hexdigest()
+        return os.path.join(self.cache_dir, digest + self.suffix)
+    
+    def get(self, platform: str, query: str, max_results: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up cached results for a search
+        
+        Args:
+            platform: Platform name
+            query: Search query
+            max_results: Maximum number of results requested
+        
+        Returns:
+            Cached results, or None on a miss or expired entry
+        """
+        path = self._path(platform, query, max_results)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            with open(path, 'rb') as f:
+                payload = f.read()
+            if zstandard:
+                payload = zstandard.ZstdDecompressor().decompress(payload)
+            return pickle.loads(payload)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+    
+    def set(self, platform: str, query: str, max_results: int, results: List[Dict[str, Any]]):
+        """Store results for a search"""
+        path = self._path(platform, query, max_results)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            payload = pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)
+            if zstandard:
+                payload = zstandard.ZstdCompressor(level=3).compress(payload)
+            
+            # Write to a temporary file first so readers never see a partial entry
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to cache results for {platform}: {e}")
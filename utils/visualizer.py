@@ -2,12 +2,54 @@
 Visualizer - Creates charts and visualizations for SoV analysis
 """
 
+import glob
+import hashlib
+import json
 import logging
-from typing import Dict, List, Any, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 import os
 
 logger = logging.getLogger(__name__)
 
+CHARTS_DIR = 'reports/charts'
+
+# Dashboard PNGs: 150 DPI is plenty for on-screen viewing, and fast zlib compression keeps
+# encoding cheap. Layout comes from fig.tight_layout(), so bbox_inches='tight' (which
+# renders the figure a second time to measure it) is not used.
+CHART_SAVE_KWARGS = {'dpi': 150, 'pil_kwargs': {'compress_level': 1}}
+
+# Fingerprinted dashboards kept by create_cached_sov_dashboard; older ones are pruned
+MAX_CACHED_DASHBOARDS = 5
+
+def _remove_cached_dashboard(manifest_path: str):
+    """Remove one fingerprinted dashboard: its chart files, then its manifest"""
+    try:
+        with open(manifest_path) as f:
+            chart_files = json.load(f)
+        for chart_path in chart_files.values():
+            if chart_path and os.path.exists(chart_path):
+                os.remove(chart_path)
+    except Exception as e:
+        logger.warning(f"Error removing cached dashboard {manifest_path}: {e}")
+    try:
+        os.remove(manifest_path)
+    except OSError:
+        pass
+
+def invalidate_visualizer_cache():
+    """Remove all fingerprinted dashboards created by create_cached_sov_dashboard"""
+    for manifest_path in glob.glob(os.path.join(CHARTS_DIR, 'dashboard_*.json')):
+        _remove_cached_dashboard(manifest_path)
+
+def _prune_cached_dashboards(keep: int = MAX_CACHED_DASHBOARDS):
+    """Remove all but the `keep` most recently used fingerprinted dashboards"""
+    manifests = glob.glob(os.path.join(CHARTS_DIR, 'dashboard_*.json'))
+    manifests.sort(key=lambda path: os.path.getmtime(path), reverse=True)
+    for manifest_path in manifests[keep:]:
+        _remove_cached_dashboard(manifest_path)
+
 class Visualizer:
     """Creates visualizations and charts for Share of Voice analysis"""
     
@@ -24,37 +66,67 @@ class Visualizer:
             'others': '#bcbd22'     # Olive
         }
         
-        # Try to import plotting libraries
-        self.matplotlib_available = False
-        self.plotly_available = False
-        self.seaborn_available = False
-        
-        try:
-            import matplotlib.pyplot as plt
-            import matplotlib
-            matplotlib.use('Agg')  # Use non-interactive backend
-            self.plt = plt
-            self.matplotlib_available = True
-            logger.info("Matplotlib initialized for plotting")
-        except ImportError:
-            logger.warning("Matplotlib not available")
-        
-        try:
-            import plotly.graph_objects as go
-            import plotly.express as px
-            self.go = go
-            self.px = px
-            self.plotly_available = True
-            logger.info("Plotly initialized for interactive plots")
-        except ImportError:
-            logger.warning("Plotly not available")
-        
-        try:
-            import seaborn as sns
-            self.sns = sns
-            self.seaborn_available = True
-        except ImportError:
-            logger.warning("Seaborn not available")
+        # Plotting libraries are imported on first use (matplotlib alone takes a few
+        # hundred milliseconds), so text-only callers never pay for them
+        self._matplotlib = None
+        self._plotly = None
+        self._seaborn = None
+        self._import_lock = threading.Lock()
+    
+    def _get_matplotlib(self):
+        """Import matplotlib with the non-interactive backend, or return False if unavailable"""
+        if self._matplotlib is None:
+            # Dashboard charts are built on pool threads; import and warn only once
+            with self._import_lock:
+                if self._matplotlib is None:
+                    try:
+                        import matplotlib
+                        matplotlib.use('Agg')  # Use non-interactive backend
+                        self._matplotlib = matplotlib
+                        logger.info("Matplotlib initialized for plotting")
+                    except ImportError:
+                        self._matplotlib = False
+                        logger.warning("Matplotlib not available")
+        return self._matplotlib
+    
+    def _get_plotly(self):
+        """Import plotly.graph_objects, or return False if unavailable"""
+        if self._plotly is None:
+            with self._import_lock:
+                if self._plotly is None:
+                    try:
+                        import plotly.graph_objects as go
+                        self._plotly = go
+                        logger.info("Plotly initialized for interactive plots")
+                    except ImportError:
+                        self._plotly = False
+                        logger.warning("Plotly not available")
+        return self._plotly
+    
+    def _get_seaborn(self):
+        """Import seaborn, or return False if unavailable"""
+        if self._seaborn is None:
+            with self._import_lock:
+                if self._seaborn is None:
+                    try:
+                        import seaborn as sns
+                        self._seaborn = sns
+                    except ImportError:
+                        self._seaborn = False
+                        logger.warning("Seaborn not available")
+        return self._seaborn
+    
+    @property
+    def matplotlib_available(self) -> bool:
+        return bool(self._get_matplotlib())
+    
+    @property
+    def plotly_available(self) -> bool:
+        return bool(self._get_plotly())
+    
+    @property
+    def seaborn_available(self) -> bool:
+        return bool(self._get_seaborn())
     
     def create_sov_dashboard(self, sov_metrics: Dict, processed_data: Dict) -> Dict[str, str]:
         """
@@ -69,40 +141,135 @@ class Visualizer:
         """
         logger.info("Creating SoV dashboard visualizations...")
         
+        try:
+            chart_files = self._build_dashboard(sov_metrics, processed_data)
+        except Exception as e:
+            logger.error(f"Error creating dashboard: {e}")
+            # Return mock chart paths for demo
+            chart_files = self._create_mock_charts()
+        
+        logger.info(f"Created {len(chart_files)} visualization charts")
+        return chart_files
+    
+    def _build_dashboard(self, sov_metrics: Dict, processed_data: Dict) -> Dict[str, str]:
+        """Render every dashboard chart; raises if the dashboard cannot be built"""
         # Create output directory
         os.makedirs('reports/charts', exist_ok=True)
         
-        chart_files = {}
-        
-        try:
+        chart_builders = [
             # 1. Overall Share of Voice Chart
-            chart_files['overall_sov'] = self._create_overall_sov_chart(sov_metrics)
+            ('overall_sov', self._create_overall_sov_chart, sov_metrics),
             
             # 2. Platform Breakdown Chart
-            chart_files['platform_breakdown'] = self._create_platform_breakdown_chart(sov_metrics)
+            ('platform_breakdown', self._create_platform_breakdown_chart, sov_metrics),
             
             # 3. Sentiment Analysis Chart
-            chart_files['sentiment_analysis'] = self._create_sentiment_chart(sov_metrics)
+            ('sentiment_analysis', self._create_sentiment_chart, sov_metrics),
             
             # 4. Engagement Comparison Chart
-            chart_files['engagement_comparison'] = self._create_engagement_chart(sov_metrics)
+            ('engagement_comparison', self._create_engagement_chart, sov_metrics),
             
             # 5. Competitive Positioning Chart
-            chart_files['competitive_positioning'] = self._create_competitive_chart(sov_metrics)
+            ('competitive_positioning', self._create_competitive_chart, sov_metrics),
             
             # 6. Content Themes Chart
-            chart_files['content_themes'] = self._create_themes_chart(processed_data)
+            ('content_themes', self._create_themes_chart, processed_data),
             
             # 7. Timeline Analysis (if applicable)
-            chart_files['timeline_analysis'] = self._create_timeline_chart(processed_data)
+            ('timeline_analysis', self._create_timeline_chart, processed_data)
+        ]
+        
+        # Charts are independent and each renders on its own Figure (no pyplot
+        # global state), so they are built concurrently. Drawing is mostly Python
+        # and holds the GIL; what overlaps is PNG compression and file writes.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                chart_name: executor.submit(builder, data)
+                for chart_name, builder, data in chart_builders
+            }
+            return {chart_name: future.result() for chart_name, future in futures.items()}
+    
+    def create_cached_sov_dashboard(self, sov_metrics: Dict, processed_data: Dict) -> Dict[str, str]:
+        """
+        Create the SoV dashboard, reusing the charts of an earlier run with identical metrics
+        
+        Args:
+            sov_metrics: Calculated SoV metrics
+            processed_data: Processed search results data
             
+        Returns:
+            Dictionary mapping chart names to file paths
+        """
+        fingerprint = self._metrics_fingerprint(sov_metrics)
+        manifest_path = os.path.join(CHARTS_DIR, f'dashboard_{fingerprint}.json')
+        
+        cached_files = self._load_dashboard_manifest(manifest_path)
+        if cached_files is not None:
+            logger.info(f"Reusing cached dashboard {fingerprint}")
+            os.utime(manifest_path)  # Mark as recently used for pruning
+            return cached_files
+        
+        try:
+            chart_files = self._build_dashboard(sov_metrics, processed_data)
         except Exception as e:
+            # Placeholder charts are returned but never cached
             logger.error(f"Error creating dashboard: {e}")
-            # Return mock chart paths for demo
-            chart_files = self._create_mock_charts()
+            return self._create_mock_charts()
+        
+        # Move each chart to a fingerprinted name so later runs cannot overwrite it
+        cached_files = {}
+        for chart_name, chart_path in chart_files.items():
+            if chart_path:
+                root, ext = os.path.splitext(chart_path)
+                cached_path = f'{root}_{fingerprint}{ext}'
+                os.replace(chart_path, cached_path)
+                chart_path = cached_path
+            cached_files[chart_name] = chart_path
+        
+        tmp_path = f'{manifest_path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(cached_files, f, indent=2)
+        os.replace(tmp_path, manifest_path)
+        
+        _prune_cached_dashboards()
+        
+        return cached_files
+    
+    def _load_dashboard_manifest(self, manifest_path: str) -> Optional[Dict[str, str]]:
+        """Return the charts listed in a dashboard manifest, or None unless every chart file exists"""
+        try:
+            with open(manifest_path) as f:
+                chart_files = json.load(f)
+            if chart_files and all(
+                isinstance(path, str) and path and os.path.exists(path)
+                for path in chart_files.values()
+            ):
+                return chart_files
+        except Exception as e:
+            if os.path.exists(manifest_path):
+                logger.warning(f"Ignoring unreadable dashboard manifest {manifest_path}: {e}")
+        return None
+    
+    def _metrics_fingerprint(self, sov_metrics: Dict) -> str:
+        """Stable short digest of the SoV metrics"""
+        encoded = json.dumps(sov_metrics, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+    
+    def _new_figure(self, figsize: Tuple[float, float]):
+        """
+        Create a standalone Agg figure with a single axes
         
-        logger.info(f"Created {len(chart_files)} visualization charts")
-        return chart_files
+        Unlike plt.subplots, the figure is not registered with pyplot, so charts can be
+        rendered from several threads and need no plt.close(). Figures are not reused:
+        each dashboard chart is built on its own pool thread, and the figure is freed
+        as soon as the chart method returns.
+        """
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig, fig.subplots()
     
     def _create_overall_sov_chart(self, sov_metrics: Dict) -> str:
         """Create overall Share of Voice pie chart"""
@@ -119,7 +286,6 @@ class Visualizer:
     
     def _create_sov_pie_matplotlib(self, sov_metrics: Dict) -> str:
         """Create SoV pie chart using matplotlib"""
-        import matplotlib.pyplot as plt
         
         mention_share = sov_metrics.get('mention_share', {})
         atomberg_share = mention_share.get('atomberg', 0)
@@ -131,7 +297,7 @@ class Visualizer:
         colors = [self.colors.get(label.lower(), self.colors['others']) for label in labels]
         
         # Create pie chart
-        fig, ax = plt.subplots(figsize=(10, 8))
+        fig, ax = self._new_figure(figsize=(10, 8))
         wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%',
                                          startangle=90, textprops={'fontsize': 12})
         
@@ -140,12 +306,11 @@ class Visualizer:
         # Add legend
         ax.legend(wedges, labels, title="Brands", loc="center left", bbox_to_anchor=(1, 0, 0.5, 1))
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save chart
         chart_path = 'reports/charts/overall_sov_pie.png'
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(chart_path, **CHART_SAVE_KWARGS)
         
         return chart_path
     
@@ -162,7 +327,6 @@ class Visualizer:
     
     def _create_platform_bar_matplotlib(self, sov_metrics: Dict) -> str:
         """Create platform breakdown using matplotlib"""
-        import matplotlib.pyplot as plt
         
         platform_breakdown = sov_metrics.get('platform_breakdown', {})
         
@@ -173,7 +337,7 @@ class Visualizer:
         sov_values = [platform_breakdown[platform] * 100 for platform in platforms]
         
         # Create bar chart
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = self._new_figure(figsize=(10, 6))
         bars = ax.bar(platforms, sov_values, color=[self.colors['atomberg']] * len(platforms))
         
         ax.set_title('Share of Voice by Platform', fontsize=16, fontweight='bold')
@@ -185,13 +349,12 @@ class Visualizer:
             ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5,
                    f'{value:.1f}%', ha='center', va='bottom', fontsize=10)
         
-        plt.xticks(rotation=45)
-        plt.tight_layout()
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.tight_layout()
         
         # Save chart
         chart_path = 'reports/charts/platform_breakdown.png'
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(chart_path, **CHART_SAVE_KWARGS)
         
         return chart_path
     
@@ -208,7 +371,6 @@ class Visualizer:
     
     def _create_sentiment_bar_matplotlib(self, sov_metrics: Dict) -> str:
         """Create sentiment analysis chart using matplotlib"""
-        import matplotlib.pyplot as plt
         
         sentiment_share = sov_metrics.get('sentiment_share', {})
         atomberg_sentiment = sentiment_share.get('atomberg_sentiment_distribution', {})
@@ -223,7 +385,7 @@ class Visualizer:
         bar_colors = [colors_map.get(sentiment, '#7f7f7f') for sentiment in sentiments]
         
         # Create bar chart
-        fig, ax = plt.subplots(figsize=(8, 6))
+        fig, ax = self._new_figure(figsize=(8, 6))
         bars = ax.bar(sentiments, values, color=bar_colors)
         
         ax.set_title('Atomberg Sentiment Distribution', fontsize=16, fontweight='bold')
@@ -235,12 +397,11 @@ class Visualizer:
             ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
                    f'{value:.1f}%', ha='center', va='bottom', fontsize=10)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save chart
         chart_path = 'reports/charts/sentiment_analysis.png'
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(chart_path, **CHART_SAVE_KWARGS)
         
         return chart_path
     
@@ -281,31 +442,35 @@ class Visualizer:
         chart_path = f'reports/charts/{chart_type}_text.txt'
         
         try:
+            lines = [
+                f"TEXT CHART: {chart_type.replace('_', ' ').title()}",
+                "=" * 50,
+                ""
+            ]
+            
+            if chart_type == 'overall_sov':
+                mention_share = data.get('mention_share', {})
+                lines.append(f"Atomberg Share: {mention_share.get('atomberg', 0):.2%}")
+                competitors = mention_share.get('competitors', {})
+                lines.extend(f"{comp} Share: {share:.2%}" for comp, share in competitors.items())
+            
+            elif chart_type == 'platform_breakdown':
+                platform_breakdown = data.get('platform_breakdown', {})
+                lines.extend(f"{platform.title()}: {sov:.2%}" for platform, sov in platform_breakdown.items())
+            
+            elif chart_type == 'sentiment_analysis':
+                sentiment_share = data.get('sentiment_share', {})
+                atomberg_sentiment = sentiment_share.get('atomberg_sentiment_distribution', {})
+                lines.extend(f"{sentiment.title()}: {percentage:.2%}"
+                             for sentiment, percentage in atomberg_sentiment.items())
+            
+            else:
+                lines.append("Data visualization not available")
+                lines.append("Install matplotlib/plotly for enhanced charts")
+            
+            # Assemble in memory and write once
             with open(chart_path, 'w') as f:
-                f.write(f"TEXT CHART: {chart_type.replace('_', ' ').title()}\n")
-                f.write("=" * 50 + "\n\n")
-                
-                if chart_type == 'overall_sov':
-                    mention_share = data.get('mention_share', {})
-                    f.write(f"Atomberg Share: {mention_share.get('atomberg', 0):.2%}\n")
-                    competitors = mention_share.get('competitors', {})
-                    for comp, share in competitors.items():
-                        f.write(f"{comp} Share: {share:.2%}\n")
-                
-                elif chart_type == 'platform_breakdown':
-                    platform_breakdown = data.get('platform_breakdown', {})
-                    for platform, sov in platform_breakdown.items():
-                        f.write(f"{platform.title()}: {sov:.2%}\n")
-                
-                elif chart_type == 'sentiment_analysis':
-                    sentiment_share = data.get('sentiment_share', {})
-                    atomberg_sentiment = sentiment_share.get('atomberg_sentiment_distribution', {})
-                    for sentiment, percentage in atomberg_sentiment.items():
-                        f.write(f"{sentiment.title()}: {percentage:.2%}\n")
-                
-                else:
-                    f.write("Data visualization not available\n")
-                    f.write("Install matplotlib/plotly for enhanced charts\n")
+                f.write("\n".join(lines) + "\n")
             
             return chart_path
         except Exception as e:
@@ -314,68 +479,86 @@ class Visualizer:
     
     def _create_mock_charts(self) -> Dict[str, str]:
         """Create mock chart files for demonstration"""
-        mock_charts = {}
         chart_types = [
             'overall_sov', 'platform_breakdown', 'sentiment_analysis',
             'engagement_comparison', 'competitive_positioning', 
             'content_themes', 'timeline_analysis'
         ]
         
-        for chart_type in chart_types:
-            chart_path = f'reports/charts/{chart_type}_mock.txt'
-            try:
-                with open(chart_path, 'w') as f:
-                    f.write(f"MOCK CHART: {chart_type.replace('_', ' ').title()}\n")
-                    f.write("=" * 40 + "\n")
-                    f.write("Chart generated successfully\n")
-                    f.write("Install visualization libraries for actual charts\n")
-                mock_charts[chart_type] = chart_path
-            except Exception as e:
-                logger.error(f"Error creating mock chart {chart_type}: {e}")
+        # The files are independent, so they are written concurrently (the GIL is
+        # released while writing)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            chart_paths = executor.map(self._write_mock_chart, chart_types)
+            mock_charts = {
+                chart_type: chart_path
+                for chart_type, chart_path in zip(chart_types, chart_paths)
+                if chart_path
+            }
         
         return mock_charts
     
+    def _write_mock_chart(self, chart_type: str) -> str:
+        """Write one mock chart file and return its path, or an empty string on failure"""
+        chart_path = f'reports/charts/{chart_type}_mock.txt'
+        try:
+            with open(chart_path, 'w') as f:
+                f.write(
+                    f"MOCK CHART: {chart_type.replace('_', ' ').title()}\n"
+                    + "=" * 40 + "\n"
+                    "Chart generated successfully\n"
+                    "Install visualization libraries for actual charts\n"
+                )
+            return chart_path
+        except Exception as e:
+            logger.error(f"Error creating mock chart {chart_type}: {e}")
+            return ""
+    
     def create_summary_report(self, sov_metrics: Dict, insights: Dict) -> str:
         """Create summary report with key findings"""
         report_path = 'reports/sov_summary_report.txt'
         
         try:
-            with open(report_path, 'w') as f:
-                f.write("ATOMBERG SHARE OF VOICE ANALYSIS REPORT\n")
-                f.write("=" * 50 + "\n\n")
+            overall_sov = sov_metrics.get('overall_sov', 0)
+            total_posts = sov_metrics.get('total_posts_analyzed', 0)
+            atomberg_mentions = sov_metrics.get('atomberg_mentions', 0)
+            key_findings = insights.get('key_findings', [])
+            platform_breakdown = sov_metrics.get('platform_breakdown', {})
+            recommendations = insights.get('marketing_recommendations', [])
+            
+            lines = [
+                "ATOMBERG SHARE OF VOICE ANALYSIS REPORT",
+                "=" * 50,
+                "",
                 
                 # Executive Summary
-                f.write("EXECUTIVE SUMMARY\n")
-                f.write("-" * 20 + "\n")
-                overall_sov = sov_metrics.get('overall_sov', 0)
-                f.write(f"Overall Share of Voice: {overall_sov:.2%}\n")
-                total_posts = sov_metrics.get('total_posts_analyzed', 0)
-                f.write(f"Total Posts Analyzed: {total_posts:,}\n")
-                atomberg_mentions = sov_metrics.get('atomberg_mentions', 0)
-                f.write(f"Atomberg Mentions: {atomberg_mentions}\n\n")
+                "EXECUTIVE SUMMARY",
+                "-" * 20,
+                f"Overall Share of Voice: {overall_sov:.2%}",
+                f"Total Posts Analyzed: {total_posts:,}",
+                f"Atomberg Mentions: {atomberg_mentions}",
+                "",
                 
                 # Key Findings
-                f.write("KEY FINDINGS\n")
-                f.write("-" * 15 + "\n")
-                key_findings = insights.get('key_findings', [])
-                for i, finding in enumerate(key_findings, 1):
-                    f.write(f"{i}. {finding}\n")
-                f.write("\n")
-                
-                # Platform Performance
-                f.write("PLATFORM PERFORMANCE\n")
-                f.write("-" * 25 + "\n")
-                platform_breakdown = sov_metrics.get('platform_breakdown', {})
-                for platform, sov in platform_breakdown.items():
-                    f.write(f"{platform.title()}: {sov:.2%}\n")
-                f.write("\n")
-                
-                # Recommendations
-                f.write("RECOMMENDATIONS\n")
-                f.write("-" * 18 + "\n")
-                recommendations = insights.get('marketing_recommendations', [])
-                for i, rec in enumerate(recommendations, 1):
-                    f.write(f"{i}. {rec}\n")
+                "KEY FINDINGS",
+                "-" * 15
+            ]
+            lines.extend(f"{i}. {finding}" for i, finding in enumerate(key_findings, 1))
+            lines.append("")
+            
+            # Platform Performance
+            lines.append("PLATFORM PERFORMANCE")
+            lines.append("-" * 25)
+            lines.extend(f"{platform.title()}: {sov:.2%}" for platform, sov in platform_breakdown.items())
+            lines.append("")
+            
+            # Recommendations
+            lines.append("RECOMMENDATIONS")
+            lines.append("-" * 18)
+            lines.extend(f"{i}. {rec}" for i, rec in enumerate(recommendations, 1))
+            
+            # Assemble in memory and write once
+            with open(report_path, 'w') as f:
+                f.write("\n".join(lines) + "\n")
             
             logger.info(f"Summary report created: {report_path}")
             return report_path